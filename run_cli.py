@@ -7,7 +7,9 @@ import sys
 from pathlib import Path
 
 # Add path for importing modules
-sys.path.insert(0, str(Path(__file__).parent))
+_project_root = str(Path(__file__).parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 
 from src.cli.cli_app import main
 
@@ -0,0 +1 @@
+"""File backup application"""
@@ -1,35 +1,63 @@
 """
 CLI Application for Backup
 - Run backup using saved configuration
+- Display status and clean up old logs
 """
 
-import argparse
+import atexit
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
+from types import SimpleNamespace
 
 # Add path for importing modules
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+_project_root = str(Path(__file__).parent.parent.parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 
 from src.utils.logger import get_logger
 from src.utils.log_manager import LogManager
 from src.core.config_manager import ConfigManager
-from src.core.backup_engine import BackupEngine
 
 
 class BackupCLI:
-    """CLI Application for Backup"""
-
-    def __init__(self):
-        """Create CLI instance"""
-        self.logger = get_logger()
-        self.log_manager = LogManager()
-        self.config_manager = ConfigManager()
-        self.backup_engine = BackupEngine(self.logger)
+    """
+    CLI Application for Backup
+
+    Components are created on first use, so each command only builds what it needs.
+    """
+
+    @cached_property
+    def logger(self):
+        """BackupLogger instance"""
+        return get_logger()
+
+    @cached_property
+    def log_manager(self):
+        """LogManager instance"""
+        return LogManager()
+
+    @cached_property
+    def config_manager(self):
+        """ConfigManager instance"""
+        config_manager = ConfigManager()
+        # Pending config changes are written once when the CLI exits
+        atexit.register(config_manager.save_config)
+        return config_manager
+
+    @cached_property
+    def backup_engine(self):
+        """BackupEngine instance"""
+        # Imported here so --status / log cleanup don't load the backup engine
+        from src.core.backup_engine import BackupEngine
+        return BackupEngine(self.logger)
 
     def backup_from_config(self):
         """Run backup using config settings"""
-        input_paths = self.config_manager.get('backup.input_paths', [])
-        output_path = self.config_manager.get('backup.output_path')
+        cfg = self.config_manager.get_many(['backup.input_paths', 'backup.output_path'])
+        input_paths = cfg['backup.input_paths'] or []
+        output_path = cfg['backup.output_path']
 
         if not input_paths or len(input_paths) == 0:
             self.logger.error("No source folders configured")
@@ -42,18 +70,19 @@ class BackupCLI:
             return False
 
         self.logger.info("Starting backup (CLI mode)")
-        self.logger.info(f"Source folders: {len(input_paths)} folder(s)")
-        for idx, path in enumerate(input_paths, 1):
-            self.logger.info(f"  [{idx}] {path}")
+        self.logger.info(
+            f"Source folders: {len(input_paths)} folder(s)\n"
+            + "\n".join(f"  [{idx}] {path}" for idx, path in enumerate(input_paths, 1))
+        )
         self.logger.info(f"Destination folder: {output_path}")
 
-        # Run multi-folder backup
-        result = self.backup_engine.backup_multiple(input_paths, output_path)
+        # Run multi-folder backup (folders are backed up concurrently).
+        # Nobody watches a percentage here, so files aren't counted up front.
+        result = self.backup_engine.backup_multiple_parallel(input_paths, output_path, count_first=False)
 
         if result['success']:
             self.logger.success("All backups completed successfully")
             self.config_manager.update_last_backup()
-            self.config_manager.save_config()
             return True
         else:
             self.logger.error(f"Some backups failed: {result['failed']}/{result['total_folders']} folders")
@@ -61,38 +90,44 @@ class BackupCLI:
 
     def show_status(self):
         """Display system status"""
-        print("=" * 60)
-        print("Backup System Status")
-        print("=" * 60)
+        cfg = self.config_manager.get_many([
+            'backup.input_paths',
+            'backup.output_path',
+            'backup.last_backup'
+        ])
 
         # Source Folders
-        input_paths = self.config_manager.get('backup.input_paths', [])
-        print(f"\nSource folders: {len(input_paths)} folder(s)")
+        input_paths = cfg['backup.input_paths'] or []
         if len(input_paths) == 0:
-            print("  (No folders configured)")
+            folder_lines = "  (No folders configured)"
         else:
-            for idx, path in enumerate(input_paths, 1):
-                print(f"  [{idx}] {path}")
+            folder_lines = "\n".join(f"  [{idx}] {path}" for idx, path in enumerate(input_paths, 1))
 
         # Destination Folder
-        output_path = self.config_manager.get('backup.output_path', '-')
-        print(f"\nDestination folder: {output_path}")
+        output_path = cfg['backup.output_path'] or '-'
 
         # Last backup
-        last_backup = self.config_manager.get('backup.last_backup')
-        if last_backup:
-            print(f"\nLast backup: {last_backup}")
-        else:
-            print("\nNo backup performed yet")
+        last_backup = cfg['backup.last_backup']
+        last_backup_line = f"Last backup: {last_backup}" if last_backup else "No backup performed yet"
 
         # Log files
-        log_info = self.log_manager.get_log_files_info()
-        total_bytes, total_mb = self.log_manager.get_total_log_size()
-
-        print(f"\nLog files: {len(log_info)} files")
-        print(f"Total size: {total_mb} MB")
-
-        print("=" * 60)
+        log_info, total_bytes, total_mb = self.log_manager.summarize()
+
+        # Whole report is written to stdout in one call
+        separator = "=" * 60
+        print(
+            f"{separator}\n"
+            f"Backup System Status\n"
+            f"{separator}\n"
+            f"\nSource folders: {len(input_paths)} folder(s)\n"
+            f"{folder_lines}\n"
+            f"\nDestination folder: {output_path}\n"
+            f"\n{last_backup_line}\n"
+            f"\nLog files: {len(log_info)} files\n"
+            f"Total size: {total_mb} MB\n"
+            f"{separator}",
+            flush=True
+        )
 
     def cleanup_logs(self):
         """Clean up old log files"""
@@ -108,36 +143,127 @@ class BackupCLI:
         self.logger.info("Cleanup completed")
 
 
-def main():
-    """Main function - Auto-run all functions sequentially"""
-    # Create CLI instance
-    cli = BackupCLI()
+def auto_run(cli):
+    """
+    Auto-run status, backup and log cleanup
 
+    Args:
+        cli: BackupCLI instance
+
+    Returns:
+        bool: True if backup succeeded
+    """
     print("\n" + "=" * 60)
-    print("AUTO-RUN MODE: Running all functions sequentially...")
+    print("AUTO-RUN MODE: Running status, backup and log cleanup...")
     print("=" * 60 + "\n")
 
-    # Step 1: Display system status
-    print("\n[STEP 1/3] Displaying system status...")
-    print("-" * 60)
-    cli.show_status()
+    # Create shared components before worker threads use them
+    _ = (cli.logger, cli.config_manager, cli.log_manager)
+
+    # Status and log cleanup don't depend on the backup result, so they run
+    # on worker threads while the backup runs on the main thread
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        status_future = executor.submit(cli.show_status)
+        cleanup_future = executor.submit(cli.cleanup_logs)
 
-    # Step 2: Run backup
-    print("\n[STEP 2/3] Running backup...")
-    print("-" * 60)
-    success = cli.backup_from_config()
+        success = cli.backup_from_config()
 
-    # Step 3: Clean up old logs
-    print("\n[STEP 3/3] Cleaning up old logs...")
-    print("-" * 60)
-    cli.cleanup_logs()
+        for future in (status_future, cleanup_future):
+            try:
+                future.result()
+            except Exception as e:
+                cli.logger.error(f"Error in auto-run step: {e}")
 
     # Final summary
-    print("\n" + "=" * 60)
-    print("AUTO-RUN COMPLETED")
-    print("=" * 60)
-    print(f"Backup status: {'SUCCESS' if success else 'FAILED'}")
-    print("=" * 60 + "\n")
+    summary = [
+        "\n" + "=" * 60,
+        "AUTO-RUN COMPLETED",
+        "=" * 60,
+        f"Backup status: {'SUCCESS' if success else 'FAILED'}",
+        "=" * 60 + "\n"
+    ]
+    sys.stdout.write("\n".join(summary) + "\n")
+    sys.stdout.flush()
+
+    return success
+
+
+def create_parser():
+    """
+    Create command line argument parser
+
+    Returns:
+        argparse.ArgumentParser instance
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="File Backup Application (CLI)",
+        epilog="Without options, runs --auto-run (used by the BAT files and Task Scheduler)."
+    )
+
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--backup", action="store_true", help="run backup using saved configuration")
+    group.add_argument("--status", action="store_true", help="display system status")
+    group.add_argument("--cleanup-logs", action="store_true", help="clean up old log files")
+    group.add_argument("--auto-run", action="store_true", help="show status, run backup and clean up logs")
+
+    return parser
+
+
+# Options handled without building the argparse parser (attribute name for each)
+FAST_OPTIONS = {
+    "--backup": "backup",
+    "--status": "status",
+    "--cleanup-logs": "cleanup_logs",
+    "--auto-run": "auto_run"
+}
+
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments
+
+    No option or a single known option is dispatched directly; anything else
+    (--help, unknown or combined options) goes through argparse.
+
+    Args:
+        argv: list of arguments (uses sys.argv[1:] if not specified)
+
+    Returns:
+        namespace with backup, status, cleanup_logs and auto_run flags
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if len(argv) <= 1 and all(arg in FAST_OPTIONS for arg in argv):
+        args = SimpleNamespace(**{name: False for name in FAST_OPTIONS.values()})
+        for arg in argv:
+            setattr(args, FAST_OPTIONS[arg], True)
+        return args
+
+    return create_parser().parse_args(argv)
+
+
+def main():
+    """Main function - Parse arguments and run the requested command"""
+    args = parse_args()
+
+    # Create CLI instance
+    cli = BackupCLI()
+
+    if args.status:
+        cli.show_status()
+        sys.exit(0)
+
+    if args.cleanup_logs:
+        cli.cleanup_logs()
+        sys.exit(0)
+
+    if args.backup:
+        success = cli.backup_from_config()
+    else:
+        success = auto_run(cli)
 
     sys.exit(0 if success else 1)
 
@@ -0,0 +1 @@
+"""Backup engine and configuration"""
@@ -6,32 +6,86 @@ File/Folder Backup System
 - Compress to ZIP if backing up same day
 """
 
+import hashlib
+import json
 import shutil
 import os
+import subprocess
 from pathlib import Path
 from datetime import datetime
 import time
+import tarfile
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+# Write buffer of the ZIP file (fewer, larger write calls than the 8 KiB default)
+ZIP_WRITE_BUFFER_SIZE = 1 << 20
+
+# Minimum seconds between two progress callbacks (keeps GUI/log from flooding)
+PROGRESS_INTERVAL = 0.05
+
+# Maximum number of error messages kept per backup (the rest are only counted)
+MAX_ERRORS = 1000
+
+# Units used by _format_size, each 1024 times the previous one
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Incremental quick backup manifest kept in the destination folder, one per source
+# folder; maps each file's relative path to its [size, mtime_ns] at the last backup.
+# {key} is a short hash of the full source path, so /a/docs and /b/docs differ.
+MANIFEST_FILENAME = ".{name}_{key}_manifest.json"
+
+# External multi-threaded compressors for tar backups: algo -> (command, file suffix).
+# The command reads the tar stream on stdin and writes compressed data to stdout.
+ARCHIVE_COMMANDS = {
+    'zstd': (['zstd', '-T0', '-3', '-q', '-c'], '.tar.zst'),
+    'pigz': (['pigz', '-c'], '.tar.gz')
+}
+
+# File types that are already compressed; they are stored in the ZIP as-is
+# because deflating them again costs CPU time for almost no size gain
+COMPRESSED_EXTENSIONS = frozenset({
+    '.zip', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.rar', '.zst',
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.heic',
+    '.mp3', '.m4a', '.aac', '.ogg', '.flac',
+    '.mp4', '.m4v', '.mkv', '.mov', '.avi', '.webm',
+    '.docx', '.xlsx', '.pptx'
+})
 
 
 class BackupEngine:
     """Automated file backup system"""
 
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, algo='zip', compress_level=None):
         """
         Create BackupEngine instance
 
         Args:
             logger: BackupLogger instance for logging operations
+            algo: backup archive format - 'zip' (default), or 'zstd' / 'pigz' to
+                  stream a tar through that program (falls back to 'zip' if the
+                  program is not installed)
+            compress_level: ZIP deflate level 1 (fastest) - 9 (smallest)
+                            (default: None = zlib default, 6)
         """
         self.logger = logger
+        self.compress_level = compress_level
         self.total_files = 0
         self.copied_files = 0
         self.failed_files = 0
         self.total_size = 0
         self.copied_size = 0
         self.errors = []
+        self.errors_dropped = 0
         self.callback = None
+        self._last_progress_time = 0.0
+
+        if algo != 'zip' and (algo not in ARCHIVE_COMMANDS or not shutil.which(algo)):
+            if logger:
+                logger.warning(f"Compressor '{algo}' not available, using ZIP")
+            algo = 'zip'
+        self.algo = algo
 
     def set_progress_callback(self, callback):
         """
@@ -42,37 +96,114 @@ class BackupEngine:
         """
         self.callback = callback
 
-    def _count_files(self, source_path):
+    def _report_progress(self, copied_files, action, file_path):
         """
-        Count the number of files and total size in folder
+        Call progress callback, at most once every PROGRESS_INTERVAL seconds
+
+        The last file is always reported so progress reaches 100%.
+
+        Args:
+            copied_files: number of files processed so far
+            action: action shown in the message (e.g., "Copying")
+            file_path: path of file just processed
+        """
+        if not self.callback:
+            return
+
+        now = time.monotonic()
+        last_file = 0 < self.total_files <= copied_files
+        if not last_file and now - self._last_progress_time < PROGRESS_INTERVAL:
+            return
+        self._last_progress_time = now
+
+        if self.total_files > 0:
+            progress_percent = copied_files / self.total_files * 100
+            message = f"{action}: {os.path.basename(file_path)} ({progress_percent:.1f}%)"
+        else:
+            # Files were not counted first, so only running totals are known
+            message = f"{action}: {copied_files:,} files ({self._format_size(self.copied_size)})"
+
+        self.callback(copied_files, self.total_files, message)
+
+    def _scan(self, source_path):
+        """
+        List all files in folder with their sizes and mtimes (single tree walk)
+
+        The result is used both for totals and for the backup itself,
+        so every file is listed and stat'ed only once.
 
         Args:
             source_path: path of source folder
 
         Returns:
-            tuple: (file count, total size in bytes)
+            list: (source file path, path relative to source folder, size in bytes,
+                   modification time in ns) tuples
         """
-        file_count = 0
-        total_size = 0
+        entries = []
 
         try:
-            for root, dirs, files in os.walk(source_path):
-                for file in files:
-                    file_path = Path(root) / file
-                    try:
-                        if file_path.exists():
-                            total_size += file_path.stat().st_size
-                            file_count += 1
-                    except Exception:
-                        pass
+            entries.extend(self._iter_entries(source_path))
 
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Error counting files: {e}")
 
-        return file_count, total_size
+        return entries
 
-    def _format_size(self, bytes_size):
+    def _iter_entries(self, source_path):
+        """
+        Yield files in folder with their sizes and mtimes while walking the tree
+
+        Args:
+            source_path: path of source folder
+
+        Yields:
+            tuple: (source file path, path relative to source folder, size in bytes,
+                    modification time in ns)
+        """
+        for entry, rel_path in self._walk_files(source_path):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            yield entry.path, rel_path, stat.st_size, stat.st_mtime_ns
+
+    def _walk_files(self, source_path):
+        """
+        Walk all files in folder tree using os.scandir
+
+        Directory entries carry their file type, so folders are not stat'ed and
+        each file's stat() is fetched at most once through the DirEntry.
+        Symlinked folders are not followed (same as os.walk).
+
+        Args:
+            source_path: path of source folder
+
+        Yields:
+            tuple: (os.DirEntry of file, path relative to source folder)
+        """
+        stack = [(str(source_path), "")]
+
+        while stack:
+            dir_path, rel_dir = stack.pop()
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append((entry.path, rel_path))
+                            elif entry.is_file():
+                                yield entry, rel_path
+                        except OSError:
+                            pass
+
+            except OSError as e:
+                if self.logger:
+                    self.logger.error(f"Error reading folder {dir_path}: {e}")
+
+    @staticmethod
+    def _format_size(bytes_size):
         """
         Convert byte size to human-readable format
 
@@ -82,11 +213,12 @@ class BackupEngine:
         Returns:
             str: size in human-readable format
         """
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_size < 1024.0:
-                return f"{bytes_size:.2f} {unit}"
-            bytes_size /= 1024.0
-        return f"{bytes_size:.2f} PB"
+        if bytes_size < 1024:
+            return f"{bytes_size:.2f} B"
+
+        # Unit index from the bit length (1 KB = 2^10) instead of a division loop
+        unit_index = min((int(bytes_size).bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+        return f"{bytes_size / (1 << (10 * unit_index)):.2f} {SIZE_UNITS[unit_index]}"
 
     def _get_backup_folder(self, destination, source_name):
         """
@@ -104,13 +236,42 @@ class BackupEngine:
 
         return backup_folder
 
-    def _create_zip_backup(self, source_path, backup_folder):
+    @staticmethod
+    def _open_new_archive(backup_folder, base_name, suffix, buffering=-1):
+        """
+        Create a new archive file that no other backup is writing to
+
+        Parallel jobs for sources with the same folder name (e.g. /a/docs and
+        /b/docs) share backup_<name>/ and can start in the same second, so the
+        file is created exclusively and a number is added while the name is taken.
+
+        Args:
+            backup_folder: folder to create the archive in (must exist)
+            base_name: file name without suffix (e.g., "docs_20250101_120000")
+            suffix: file name extension (e.g., ".zip")
+            buffering: buffer size passed to open()
+
+        Returns:
+            tuple: (file opened for binary writing, Path of the file)
+        """
+        archive_path = backup_folder / f"{base_name}{suffix}"
+        number = 1
+        while True:
+            try:
+                return open(archive_path, 'xb', buffering=buffering), archive_path
+            except FileExistsError:
+                archive_path = backup_folder / f"{base_name}_{number}{suffix}"
+                number += 1
+
+    def _create_zip_backup(self, source_path, backup_folder, entries):
         """
         Create ZIP file backup inside backup folder
 
         Args:
             source_path: path of source folder
             backup_folder: path to backup folder
+            entries: files to add, as returned by _scan() or _iter_entries()
+                     (when streamed, totals are filled in once all files are added)
 
         Returns:
             dict: backup operation result
@@ -118,40 +279,43 @@ class BackupEngine:
         start_time = time.time()
         source = Path(source_path)
 
-        # Create ZIP filename with timestamp
+        # ZIP filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        zip_filename = f"{source.name}_{timestamp}.zip"
-        zip_path = backup_folder / zip_filename
-
-        if self.logger:
-            self.logger.info(f"Creating ZIP backup: {zip_filename}")
 
         try:
             # Create backup folder if not exists
             backup_folder.mkdir(parents=True, exist_ok=True)
 
+            zip_file, zip_path = self._open_new_archive(
+                backup_folder, f"{source.name}_{timestamp}", ".zip", buffering=ZIP_WRITE_BUFFER_SIZE
+            )
+            zip_filename = zip_path.name
+
+            if self.logger:
+                self.logger.info(f"Creating ZIP backup: {zip_filename}")
+
             # Create ZIP file
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # Add all files to ZIP
-                for root, dirs, files in os.walk(source):
-                    for file in files:
-                        file_path = Path(root) / file
-                        arcname = file_path.relative_to(source.parent)
-
-                        zipf.write(file_path, arcname)
-
-                        self.copied_files += 1
-                        file_size = file_path.stat().st_size
-                        self.copied_size += file_size
-
-                        # Update progress
-                        if self.callback:
-                            progress_percent = (self.copied_files / self.total_files * 100) if self.total_files > 0 else 0
-                            self.callback(
-                                self.copied_files,
-                                self.total_files,
-                                f"Compressing: {file_path.name} ({progress_percent:.1f}%)"
-                            )
+            with zip_file, zipfile.ZipFile(zip_file, 'w', zipfile.ZIP_DEFLATED, allowZip64=True,
+                                           compresslevel=self.compress_level) as zipf:
+                # Add all files to ZIP (archive paths start with the source folder name)
+                for src, rel_path, file_size, _ in entries:
+                    if os.path.splitext(src)[1].lower() in COMPRESSED_EXTENSIONS:
+                        compress_type = zipfile.ZIP_STORED
+                    else:
+                        compress_type = None  # ZipFile default (ZIP_DEFLATED)
+
+                    zipf.write(src, os.path.join(source.name, rel_path), compress_type=compress_type)
+
+                    self.copied_files += 1
+                    self.copied_size += file_size
+
+                    # Update progress
+                    self._report_progress(self.copied_files, "Compressing", src)
+
+            if self.total_files == 0:
+                # Files were streamed without counting first
+                self.total_files = self.copied_files
+                self.total_size = self.copied_size
 
             elapsed_time = time.time() - start_time
 
@@ -170,7 +334,8 @@ class BackupEngine:
                 'elapsed_time': elapsed_time,
                 'destination': str(zip_path),
                 'is_zip': True,
-                'errors': self.errors
+                'errors': self.errors,
+                'errors_dropped': self.errors_dropped
             }
 
         except Exception as e:
@@ -183,13 +348,104 @@ class BackupEngine:
                 'error': error_msg
             }
 
-    def _copy_file_with_progress(self, src, dst):
+    def _create_tar_backup(self, source_path, backup_folder, entries):
+        """
+        Create compressed tar backup inside backup folder
+
+        The tar stream is piped through the external compressor for self.algo,
+        which uses all CPU cores instead of a single zlib thread.
+
+        Args:
+            source_path: path of source folder
+            backup_folder: path to backup folder
+            entries: files to add, as returned by _scan() or _iter_entries()
+
+        Returns:
+            dict: backup operation result
+        """
+        start_time = time.time()
+        source = Path(source_path)
+        command, suffix = ARCHIVE_COMMANDS[self.algo]
+
+        # Archive filename with timestamp
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        try:
+            # Create backup folder if not exists
+            backup_folder.mkdir(parents=True, exist_ok=True)
+
+            archive_file, archive_path = self._open_new_archive(
+                backup_folder, f"{source.name}_{timestamp}", suffix
+            )
+            archive_filename = archive_path.name
+
+            if self.logger:
+                self.logger.info(f"📦 Creating {self.algo} backup: {archive_filename}")
+
+            with archive_file:
+                process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=archive_file)
+                try:
+                    with tarfile.open(fileobj=process.stdin, mode='w|') as tar:
+                        # Archive paths start with the source folder name
+                        for src, rel_path, file_size, _ in entries:
+                            tar.add(src, arcname=os.path.join(source.name, rel_path), recursive=False)
+
+                            self.copied_files += 1
+                            self.copied_size += file_size
+
+                            # Update progress
+                            self._report_progress(self.copied_files, "Compressing", src)
+                finally:
+                    process.stdin.close()
+                    return_code = process.wait()
+
+            if return_code != 0:
+                raise RuntimeError(f"{self.algo} exited with code {return_code}")
+
+            if self.total_files == 0:
+                # Files were streamed without counting first
+                self.total_files = self.copied_files
+                self.total_size = self.copied_size
+
+            elapsed_time = time.time() - start_time
+
+            if self.logger:
+                self.logger.success(f"Backup created: {archive_filename}")
+                self.logger.info(f"Archive size: {self._format_size(archive_path.stat().st_size)}")
+                self.logger.info(f"Time elapsed: {elapsed_time:.2f} seconds")
+
+            return {
+                'success': True,
+                'total_files': self.total_files,
+                'copied_files': self.copied_files,
+                'failed_files': self.failed_files,
+                'total_size': self.total_size,
+                'copied_size': self.copied_size,
+                'elapsed_time': elapsed_time,
+                'destination': str(archive_path),
+                'is_zip': False,
+                'errors': self.errors,
+                'errors_dropped': self.errors_dropped
+            }
+
+        except Exception as e:
+            error_msg = f"Error creating {self.algo} backup: {e}"
+            if self.logger:
+                self.logger.error(error_msg)
+
+            return {
+                'success': False,
+                'error': error_msg
+            }
+
+    def _copy_file_with_progress(self, src, dst, file_size=None):
         """
         Copy file with progress update
 
         Args:
             src: path of source file
             dst: path of destination file
+            file_size: size of source file if already known (skips a stat call)
 
         Returns:
             bool: True if successful
@@ -203,33 +459,59 @@ class BackupEngine:
             shutil.copy2(src, dst)
 
             # Update progress
-            src_path = Path(src)
-            file_size = src_path.stat().st_size
+            if file_size is None:
+                file_size = os.stat(src).st_size
+
             self.copied_size += file_size
             self.copied_files += 1
 
             # Call callback
-            if self.callback:
-                progress_percent = (self.copied_files / self.total_files * 100) if self.total_files > 0 else 0
-                self.callback(
-                    self.copied_files,
-                    self.total_files,
-                    f"Copying: {src_path.name} ({progress_percent:.1f}%)"
-                )
+            self._report_progress(self.copied_files, "Copying", src)
 
             return True
 
         except Exception as e:
-            self.failed_files += 1
-            error_msg = f"Error copying {src}: {e}"
-            self.errors.append(error_msg)
+            self._record_error("copying", src, e)
+            return False
 
-            if self.logger:
-                self.logger.error(error_msg)
+    def _record_error(self, action, file_path, error):
+        """
+        Count a failed file and keep its error message
 
-            return False
+        Only the first MAX_ERRORS messages are kept and logged; after that
+        failures are only counted in errors_dropped.
 
-    def backup(self, source_path, destination_path, overwrite=True):
+        Args:
+            action: what failed (e.g., "copying")
+            file_path: path of file that failed
+            error: exception raised
+        """
+        self.failed_files += 1
+
+        if len(self.errors) >= MAX_ERRORS:
+            self.errors_dropped += 1
+            if self.errors_dropped == 1 and self.logger:
+                self.logger.warning(f"More than {MAX_ERRORS:,} errors; further errors are only counted")
+            return
+
+        error_msg = f"Error {action} {file_path}: {error}"
+        self.errors.append(error_msg)
+
+        if self.logger:
+            self.logger.error(error_msg)
+
+    def _reset_counters(self):
+        """Reset progress counters before a backup"""
+        self.total_files = 0
+        self.copied_files = 0
+        self.failed_files = 0
+        self.total_size = 0
+        self.copied_size = 0
+        self.errors = []
+        self.errors_dropped = 0
+        self._last_progress_time = 0.0
+
+    def backup(self, source_path, destination_path, overwrite=True, count_first=True):
         """
         Copy entire folder
 
@@ -237,19 +519,16 @@ class BackupEngine:
             source_path: path of source folder
             destination_path: path of destination folder
             overwrite: True if destination folder should be overwritten
+            count_first: count files before backing up so progress has a percentage;
+                         False streams files straight into the backup (no totals
+                         until done), which saves a full tree walk on large folders
 
         Returns:
             dict: backup operation result
         """
         start_time = time.time()
 
-        # Reset counters
-        self.total_files = 0
-        self.copied_files = 0
-        self.failed_files = 0
-        self.total_size = 0
-        self.copied_size = 0
-        self.errors = []
+        self._reset_counters()
 
         source = Path(source_path)
         destination = Path(destination_path)
@@ -280,17 +559,50 @@ class BackupEngine:
             self.logger.info(f"From: {source_path}")
             self.logger.info(f"To: {destination_path}")
 
-        # Count files
-        if self.logger:
-            self.logger.info("Counting files...")
+        warning_msg = "No files found in source folder"
 
-        self.total_files, self.total_size = self._count_files(source)
+        if count_first:
+            # Count files
+            if self.logger:
+                self.logger.info("Counting files...")
 
-        if self.logger:
-            self.logger.info(f"Found {self.total_files:,} files (Total size: {self._format_size(self.total_size)})")
+            entries = self._scan(source)
+            self.total_files = len(entries)
+            self.total_size = sum(entry[2] for entry in entries)
 
-        if self.total_files == 0:
-            warning_msg = "No files found in source folder"
+            if self.logger:
+                self.logger.info(f"Found {self.total_files:,} files (Total size: {self._format_size(self.total_size)})")
+
+            if self.total_files == 0:
+                if self.logger:
+                    self.logger.warning(warning_msg)
+                return {
+                    'success': True,
+                    'warning': warning_msg,
+                    'total_files': 0,
+                    'copied_files': 0
+                }
+        else:
+            entries = self._iter_entries(source)
+
+        # Get backup folder (e.g., backup_FolderName)
+        backup_folder = self._get_backup_folder(destination, source.name)
+
+        if self.algo in ARCHIVE_COMMANDS:
+            result = self._create_tar_backup(source, backup_folder, entries)
+        else:
+            if self.logger:
+                self.logger.info("📦 Creating ZIP backup...")
+
+            result = self._create_zip_backup(source, backup_folder, entries)
+
+        if not count_first and result['success'] and result['total_files'] == 0:
+            # Nothing was found while streaming; don't keep an empty archive
+            Path(result['destination']).unlink(missing_ok=True)
+            try:
+                backup_folder.rmdir()  # only removed if nothing else is in it
+            except OSError:
+                pass
             if self.logger:
                 self.logger.warning(warning_msg)
             return {
@@ -300,22 +612,20 @@ class BackupEngine:
                 'copied_files': 0
             }
 
-        # Get backup folder (e.g., backup_FolderName)
-        backup_folder = self._get_backup_folder(destination, source.name)
+        if not count_first and result['success'] and self.logger:
+            # Totals are only known now (same line as "Found ..." when counting first)
+            self.logger.info(f"Backed up {result['total_files']:,} files (Total size: {self._format_size(result['total_size'])})")
 
-        if self.logger:
-            self.logger.info("📦 Creating ZIP backup...")
+        return result
 
-        # Always create ZIP backup
-        return self._create_zip_backup(source, backup_folder)
-
-    def backup_multiple(self, source_paths, destination_path):
+    def backup_multiple(self, source_paths, destination_path, **backup_options):
         """
         Backup multiple folders
 
         Args:
             source_paths: list of source folder paths
             destination_path: destination folder path
+            **backup_options: extra options passed to backup() (e.g., count_first)
 
         Returns:
             dict: backup operation result with details for each folder
@@ -331,8 +641,6 @@ class BackupEngine:
             self.logger.info("=" * 60)
 
         results = []
-        total_success = 0
-        total_failed = 0
         start_time = time.time()
 
         for idx, source_path in enumerate(source_paths, 1):
@@ -343,17 +651,124 @@ class BackupEngine:
                 self.logger.info("-" * 60)
 
             # Backup this folder
-            result = self.backup(source_path, destination_path)
+            result = self.backup(source_path, destination_path, **backup_options)
             results.append({
                 'source': source_path,
                 'result': result
             })
 
-            if result['success']:
-                total_success += 1
+        return self._summarize_multiple(source_paths, results, start_time)
+
+    def backup_multiple_parallel(self, source_paths, destination_path, max_workers=None,
+                                 use_processes=False, **backup_options):
+        """
+        Backup multiple folders concurrently (one job per folder)
+
+        Args:
+            source_paths: list of source folder paths
+            destination_path: destination folder path
+            max_workers: maximum number of folders backed up at the same time
+                         (default: min(number of folders, CPU count * 2), or
+                         min(number of folders, CPU count) with use_processes)
+            use_processes: run each folder in its own process, so ZIP compression
+                           of several folders uses several CPU cores. Worker processes
+                           log to the same log folder but don't report progress.
+            **backup_options: extra options passed to backup() (e.g., count_first)
+
+        Returns:
+            dict: backup operation result with details for each folder
+        """
+        if not isinstance(source_paths, list):
+            source_paths = [source_paths]
+
+        # A single folder gains nothing from a separate process
+        use_processes = use_processes and len(source_paths) > 1
+
+        if max_workers is None:
+            cpu_count = os.cpu_count() or 1
+            max_workers = min(len(source_paths), cpu_count if use_processes else cpu_count * 2)
+        max_workers = max(1, max_workers)
+
+        if self.logger:
+            self.logger.info("=" * 60)
+            self.logger.info(f"Starting multi-folder backup (parallel)")
+            self.logger.info(f"Total folders: {len(source_paths)}")
+            self.logger.info(f"Workers: {max_workers}")
+            self.logger.info(f"Destination: {destination_path}")
+            self.logger.info("=" * 60)
+
+        start_time = time.time()
+
+        engine_options = {'algo': self.algo, 'compress_level': self.compress_level}
+
+        # Jobs log at the same time, so each line says which folder it belongs to
+        prefixes = [
+            f"[{idx}/{len(source_paths)} {Path(source_path).name}] "
+            for idx, source_path in enumerate(source_paths, 1)
+        ]
+
+        def run_one(source_path, prefix):
+            # Each job gets its own engine so per-backup counters don't collide
+            logger = _JobLogger(self.logger, prefix) if self.logger else None
+            engine = BackupEngine(logger, **engine_options)
+            engine.set_progress_callback(self.callback)
+            return engine.backup(source_path, destination_path, **backup_options)
+
+        results = []
+        # All jobs run on the pool; the caller thread only collects results
+        if use_processes:
+            log_dir = getattr(self.logger, 'log_dir', None)
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        with executor:
+            if use_processes:
+                futures = [
+                    executor.submit(_do_backup, source_path, destination_path,
+                                    log_dir, prefix, engine_options, backup_options)
+                    for source_path, prefix in zip(source_paths, prefixes)
+                ]
             else:
-                total_failed += 1
+                futures = [
+                    executor.submit(run_one, source_path, prefix)
+                    for source_path, prefix in zip(source_paths, prefixes)
+                ]
+
+            for source_path, future in zip(source_paths, futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    error_msg = f"Error backing up {source_path}: {e}"
+                    if self.logger:
+                        self.logger.error(error_msg)
+                    result = {
+                        'success': False,
+                        'error': error_msg
+                    }
+
+                results.append({
+                    'source': source_path,
+                    'result': result
+                })
+
+        return self._summarize_multiple(source_paths, results, start_time)
+
+    def _summarize_multiple(self, source_paths, results, start_time):
+        """
+        Log and build the summary of a multi-folder backup
+
+        Args:
+            source_paths: list of source folder paths
+            results: list of dict with 'source' and 'result' for each folder
+            start_time: time.time() when the backup started
 
+        Returns:
+            dict: backup operation result with details for each folder
+        """
+        total_success = sum(1 for item in results if item['result']['success'])
+        total_failed = len(results) - total_success
+        total_files = sum(item['result'].get('total_files', 0) for item in results)
         total_time = time.time() - start_time
 
         # Summary
@@ -364,6 +779,7 @@ class BackupEngine:
             self.logger.info(f"Total folders: {len(source_paths)}")
             self.logger.info(f"Successful: {total_success}")
             self.logger.info(f"Failed: {total_failed}")
+            self.logger.info(f"Total files: {total_files:,}")
             self.logger.info(f"Total time: {total_time:.2f} seconds")
             self.logger.info("=" * 60)
 
@@ -372,17 +788,95 @@ class BackupEngine:
             'total_folders': len(source_paths),
             'successful': total_success,
             'failed': total_failed,
+            'total_files': total_files,
             'elapsed_time': total_time,
             'results': results
         }
 
-    def quick_backup(self, source_path, destination_path):
+    def _load_manifest(self, manifest_path):
+        """
+        Load incremental backup manifest
+
+        Args:
+            manifest_path: path of manifest file
+
+        Returns:
+            dict: relative path -> [size, mtime_ns] (empty if there is no usable manifest)
+        """
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Ignoring unreadable manifest {manifest_path}: {e}")
+            return {}
+
+    def _save_manifest(self, manifest_path, manifest):
+        """
+        Save incremental backup manifest (atomically, so a crash keeps the old one)
+
+        Args:
+            manifest_path: path of manifest file
+            manifest: relative path -> [size, mtime_ns] of all files in the source folder
+        """
+        temp_path = f"{manifest_path}.tmp"
+
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, separators=(',', ':'))
+            os.replace(temp_path, manifest_path)
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Could not save manifest {manifest_path}: {e}")
+
+    @staticmethod
+    def _skip_unchanged(source, previous, manifest):
+        """
+        Build a shutil.copytree ignore function for incremental backups
+
+        Every file seen is recorded in manifest; files whose size and
+        modification time match previous are skipped (folders are always copied).
+
+        Args:
+            source: path of source folder
+            previous: manifest of the last backup (relative path -> [size, mtime_ns])
+            manifest: dict filled with the current state of every file
+
+        Returns:
+            callable: ignore function (folder, names) -> names to skip
+        """
+        def ignore(dir_path, names):
+            skipped = []
+            for name in names:
+                path = os.path.join(dir_path, name)
+                try:
+                    if not os.path.isfile(path):
+                        continue
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+
+                rel_path = os.path.relpath(path, source)
+                state = [stat.st_size, stat.st_mtime_ns]
+                manifest[rel_path] = state
+                if previous.get(rel_path) == state:
+                    skipped.append(name)
+            return skipped
+
+        return ignore
+
+    def quick_backup(self, source_path, destination_path, incremental=False):
         """
         Quick backup (uses shutil.copytree)
 
         Args:
             source_path: path of source folder
             destination_path: path of destination folder
+            incremental: only copy files whose size or modification time changed
+                         since the last successful incremental backup of this folder
+                         (tracked in a manifest file in destination_path)
 
         Returns:
             dict: backup operation result
@@ -412,9 +906,25 @@ class BackupEngine:
             self.logger.info(f"From: {source_path}")
             self.logger.info(f"To: {final_destination}")
 
+        ignore = None
+        if incremental:
+            source_key = hashlib.sha1(str(source.resolve()).encode('utf-8')).hexdigest()[:8]
+            manifest_path = destination / MANIFEST_FILENAME.format(name=source.name, key=source_key)
+            previous = self._load_manifest(manifest_path)
+            manifest = {}
+            ignore = self._skip_unchanged(source, previous, manifest)
+
         try:
             # Copy entire folder
-            shutil.copytree(source, final_destination)
+            shutil.copytree(source, final_destination, ignore=ignore)
+
+            # Only reached when every file was copied, so failed files are copied again next run
+            if incremental:
+                self._save_manifest(manifest_path, manifest)
+
+                if self.logger:
+                    changed = sum(1 for rel_path, state in manifest.items() if previous.get(rel_path) != state)
+                    self.logger.info(f"Changed files since last backup: {changed:,} of {len(manifest):,}")
 
             elapsed_time = time.time() - start_time
 
@@ -437,3 +947,62 @@ class BackupEngine:
                 'success': False,
                 'error': error_msg
             }
+
+
+class _JobLogger:
+    """Logger wrapper that starts every message with a job prefix"""
+
+    def __init__(self, logger, prefix):
+        """
+        Args:
+            logger: BackupLogger to write to
+            prefix: text put before each message (e.g., "[1/3 docs] ")
+        """
+        self.logger = logger
+        self.prefix = prefix
+
+    def info(self, message):
+        self.logger.info(self.prefix + message)
+
+    def warning(self, message):
+        self.logger.warning(self.prefix + message)
+
+    def error(self, message):
+        self.logger.error(self.prefix + message)
+
+    def debug(self, message):
+        self.logger.debug(self.prefix + message)
+
+    def success(self, message):
+        self.logger.success(self.prefix + message)
+
+
+def _do_backup(source_path, destination_path, log_dir, log_prefix, engine_options, backup_options):
+    """
+    Backup one folder in a worker process (see backup_multiple_parallel)
+
+    Args:
+        source_path: path of source folder
+        destination_path: path of destination folder
+        log_dir: log folder of the parent's logger (None for no logging)
+        log_prefix: text put before each log message of this job
+        engine_options: keyword arguments for BackupEngine
+        backup_options: keyword arguments for BackupEngine.backup
+
+    Returns:
+        dict: backup operation result
+    """
+    logger = None
+    if log_dir is not None:
+        # A fresh logger, not get_logger(): a forked worker inherits the parent's
+        # instance, whose queue listener thread doesn't exist in this process
+        from src.utils.logger import BackupLogger
+        logger = BackupLogger(log_dir)
+
+    try:
+        engine = BackupEngine(_JobLogger(logger, log_prefix) if logger else None, **engine_options)
+        return engine.backup(source_path, destination_path, **backup_options)
+    finally:
+        # Worker processes may exit without running atexit, so write queued records now
+        if logger is not None:
+            logger.close()
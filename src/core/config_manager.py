@@ -4,11 +4,28 @@ Application Configuration Management System
 - Manage input/output paths
 """
 
+import functools
 import json
 import os
+import threading
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson  # Optional: much faster JSON decode
+except ImportError:
+    orjson = None
+
+
+# Seconds request_save waits for more changes before writing the config file
+SAVE_DELAY = 5.0
+
+
+@functools.lru_cache(maxsize=128)
+def _split(key_path):
+    """Split a dot notation key path into its keys (cached, key paths repeat a lot)"""
+    return tuple(key_path.split('.'))
+
 
 class ConfigManager:
     """Manage application settings"""
@@ -23,6 +40,14 @@ class ConfigManager:
         self.config_file = Path(config_file)
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
 
+        # True when self.config has changes that are not saved to file yet
+        self._dirty = False
+        self.config = None
+
+        # Guards config against a delayed save running on the timer thread
+        self._lock = threading.RLock()
+        self._save_timer = None  # Pending request_save timer
+
         # Load config or create new
         self.config = self.load_config()
 
@@ -48,6 +73,10 @@ class ConfigManager:
                 "theme": "dark",  # dark, light
                 "last_window_size": "800x600"
             },
+            "dialog": {
+                "last_input_dir": "",  # Folder the source folder dialog opens in
+                "last_output_dir": ""  # Folder the destination folder dialog opens in
+            },
             "app_info": {
                 "version": "1.0.0",
                 "created_at": datetime.now().isoformat(),
@@ -69,8 +98,11 @@ class ConfigManager:
             return default_config
 
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            if orjson:
+                config = orjson.loads(self.config_file.read_bytes())
+            else:
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
 
             # Backward compatibility: convert old input_path to input_paths
             if 'backup' in config:
@@ -78,14 +110,12 @@ class ConfigManager:
                     old_path = config['backup']['input_path']
                     config['backup']['input_paths'] = [old_path] if old_path else []
                     del config['backup']['input_path']
+                    self._dirty = True
                 elif 'input_paths' not in config['backup']:
                     config['backup']['input_paths'] = []
+                    self._dirty = True
 
-            # Update last_updated
-            if 'app_info' not in config:
-                config['app_info'] = {}
-            config['app_info']['last_updated'] = datetime.now().isoformat()
-
+            # last_updated is only changed by save_config, so loading doesn't dirty the config
             return config
 
         except json.JSONDecodeError as e:
@@ -96,29 +126,71 @@ class ConfigManager:
         """
         Save settings to file
 
+        Skipped when config is not specified and nothing changed since the last save.
+
         Args:
             config: settings to save (uses self.config if not specified)
 
         Returns:
             bool: True if successful
         """
-        if config is None:
-            config = self.config
-
-        try:
-            # Update last_updated
-            if 'app_info' not in config:
-                config['app_info'] = {}
-            config['app_info']['last_updated'] = datetime.now().isoformat()
-
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4, ensure_ascii=False)
+        with self._lock:
+            if config is None:
+                # This save covers any pending request_save()
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+
+                if not self._dirty:
+                    return True
+                config = self.config
+
+            try:
+                # Update last_updated
+                if 'app_info' not in config:
+                    config['app_info'] = {}
+                config['app_info']['last_updated'] = datetime.now().isoformat()
+
+                # Always stdlib json: orjson can only indent by 2 spaces, and the file
+                # is small and hand-editable, so it keeps one 4-space format
+                data = json.dumps(config, indent=4, ensure_ascii=False).encode('utf-8')
+
+                # Write a temp file and swap it in, so a crash never leaves a half-written config
+                temp_file = self.config_file.with_suffix('.json.tmp')
+                with open(temp_file, 'wb') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_file, self.config_file)
+
+                if config is self.config:
+                    self._dirty = False
+
+                return True
+
+            except Exception as e:
+                print(f"Error saving config: {e}")
+                return False
 
-            return True
+    def request_save(self):
+        """
+        Save settings soon (after SAVE_DELAY seconds)
 
-        except Exception as e:
-            print(f"Error saving config: {e}")
-            return False
+        Changes requested within the delay are written together in one save.
+        Call save_config() to write pending changes immediately (e.g., on exit).
+        """
+        with self._lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(SAVE_DELAY, self._flush_pending_save)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def _flush_pending_save(self):
+        """Write changes requested by request_save (runs on timer thread)"""
+        with self._lock:
+            self._save_timer = None
+            self.save_config()
 
     def get(self, key_path, default=None):
         """
@@ -131,7 +203,7 @@ class ConfigManager:
         Returns:
             requested value
         """
-        keys = key_path.split('.')
+        keys = _split(key_path)
         value = self.config
 
         for key in keys:
@@ -142,6 +214,19 @@ class ConfigManager:
 
         return value
 
+    def get_many(self, key_paths, default=None):
+        """
+        Get several values from config in one call
+
+        Args:
+            key_paths: list of key paths (e.g., ["backup.input_paths", "backup.output_path"])
+            default: default value for keys that are not found
+
+        Returns:
+            dict: mapping of each key path to its value
+        """
+        return {key_path: self.get(key_path, default) for key_path in key_paths}
+
     def set(self, key_path, value):
         """
         Set value in config using dot notation
@@ -150,17 +235,20 @@ class ConfigManager:
             key_path: key path (e.g., "backup.input_path")
             value: value to set
         """
-        keys = key_path.split('.')
-        target = self.config
+        keys = _split(key_path)
+
+        with self._lock:
+            target = self.config
 
-        # Loop to second-to-last key
-        for key in keys[:-1]:
-            if key not in target:
-                target[key] = {}
-            target = target[key]
+            # Loop to second-to-last key
+            for key in keys[:-1]:
+                if key not in target:
+                    target[key] = {}
+                target = target[key]
 
-        # Set value
-        target[keys[-1]] = value
+            # Set value
+            target[keys[-1]] = value
+            self._dirty = True
 
     def get_backup_settings(self):
         """Get backup settings"""
@@ -174,7 +262,7 @@ class ConfigManager:
             input_paths: list of source folder paths
             output_path: destination folder path
         """
-        self.set('backup.input_paths', input_paths if isinstance(input_paths, list) else [input_paths])
+        self.set('backup.input_paths', list(input_paths) if isinstance(input_paths, list) else [input_paths])
         self.set('backup.output_path', output_path)
 
     def add_input_path(self, path):
@@ -186,8 +274,7 @@ class ConfigManager:
         """
         input_paths = self.get('backup.input_paths', [])
         if path and path not in input_paths:
-            input_paths.append(path)
-            self.set('backup.input_paths', input_paths)
+            self.set('backup.input_paths', input_paths + [path])
 
     def remove_input_path(self, path):
         """
@@ -198,8 +285,7 @@ class ConfigManager:
         """
         input_paths = self.get('backup.input_paths', [])
         if path in input_paths:
-            input_paths.remove(path)
-            self.set('backup.input_paths', input_paths)
+            self.set('backup.input_paths', [p for p in input_paths if p != path])
 
     def clear_input_paths(self):
         """Clear all source folder paths"""
@@ -305,6 +391,7 @@ class ConfigManager:
             # Merge config with default
             default_config = self.get_default_config()
             self.config = {**default_config, **imported_config}
+            self._dirty = True
 
             # Save
             self.save_config()
@@ -0,0 +1 @@
+"""GUI application"""
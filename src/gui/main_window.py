@@ -3,22 +3,59 @@ Main GUI for Backup Application (CustomTkinter)
 - Select Input/Output folders
 - Backup Now button
 - Real-time Log display
+
+Run with run_gui.py or `python -m src.gui.main_window` from the project folder.
 """
 
 import customtkinter as ctk
-from tkinter import filedialog, messagebox
-import sys
-import os
+from tkinter import TclError, filedialog, messagebox
+import queue
+import time
+from functools import partial
 from pathlib import Path
-import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ..utils.logger import get_logger
+from ..utils.log_manager import LogManager, format_bytes
+from ..core.config_manager import ConfigManager
+from ..core.backup_engine import BackupEngine
+
+
+# Appearance is global to CustomTkinter, so it is set once when the module loads
+ctk.set_appearance_mode("dark")
+ctk.set_default_color_theme("blue")
+
+# Milliseconds between two writes of queued log messages to the log box
+LOG_PUMP_INTERVAL_MS = 100
+
+# Lines kept in the log box; older lines are removed
+MAX_LOG_LINES = 5000
+
+# Minimum seconds between two progress messages queued for the log box
+PROGRESS_MIN_INTERVAL = 0.02
+
+# Minimum progress (fraction of total files) between two queued progress messages
+PROGRESS_MIN_DELTA = 0.005
+
+# Longest folder path shown in full in the folder list
+MAX_PATH_LABEL_WIDTH = 60
+
+
+def _shorten(path, width=MAX_PATH_LABEL_WIDTH):
+    """
+    Shorten a path for display by replacing its middle with an ellipsis
 
-# Add path for importing modules
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    Args:
+        path: path string
+        width: maximum length of the result
 
-from src.utils.logger import get_logger
-from src.utils.log_manager import LogManager, format_bytes
-from src.core.config_manager import ConfigManager
-from src.core.backup_engine import BackupEngine
+    Returns:
+        str: path unchanged if short enough, otherwise start + "…" + end
+    """
+    if len(path) <= width:
+        return path
+    keep = (width - 1) // 2
+    return f"{path[:keep]}…{path[-keep:]}"
 
 
 class BackupApp(ctk.CTk):
@@ -31,10 +68,6 @@ class BackupApp(ctk.CTk):
         self.title("File Backup Application")
         self.geometry("800x700")
 
-        # Set defaults
-        ctk.set_appearance_mode("dark")
-        ctk.set_default_color_theme("blue")
-
         # Create instances
         self.logger = get_logger()
         self.log_manager = LogManager()
@@ -42,10 +75,25 @@ class BackupApp(ctk.CTk):
         self.backup_engine = BackupEngine(self.logger)
 
         # Variables
-        self.input_paths = self.config_manager.get('backup.input_paths', [])
+        self.input_paths = []  # Filled from config after the window is shown (see _deferred_populate)
         self.output_path = ctk.StringVar(value=self.config_manager.get('backup.output_path', ''))
         self.is_backing_up = False
-        self.folder_items = []  # Track folder UI items for removal
+        self._closing = False  # Set once the window is closed (a backup may still be running)
+        self.folder_items = {}  # Folder path -> its UI item, for removal
+
+        # Backups and log maintenance run one at a time on a single reusable worker thread
+        self.background_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="backup")
+        self._pending_tasks = set()  # Futures of background work not finished yet
+
+        # Log messages (also from the background thread), written to the log box in batches
+        self.log_queue = queue.SimpleQueue()
+        self._log_pump_scheduled = False
+        self._last_progress_time = 0.0
+        self._last_progress_current = 0
+        self._last_progress_msg = None
+
+        # Fonts shared by all widgets, created on first use (see _font)
+        self._fonts = {}
 
         # Create UI
         self.create_ui()
@@ -53,12 +101,32 @@ class BackupApp(ctk.CTk):
         # Load settings
         self.load_settings()
 
-        # Run log maintenance
-        self.run_log_maintenance()
+        # Saved folders are listed once the window has been drawn
+        self.after_idle(self._deferred_populate)
+
+        # Run log maintenance (in background so the window shows right away)
+        self._submit_background(self.run_log_maintenance)
 
         # Protocol for window closing
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+    def _font(self, size, weight="normal"):
+        """
+        Get shared font (each size/weight is created once)
+
+        Args:
+            size: font size
+            weight: "normal" or "bold"
+
+        Returns:
+            CTkFont instance
+        """
+        key = (size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = ctk.CTkFont(size=size, weight=weight)
+        return font
+
     def create_ui(self):
         """Create UI"""
 
@@ -74,7 +142,7 @@ class BackupApp(ctk.CTk):
         source_header = ctk.CTkFrame(folder_frame, fg_color="transparent")
         source_header.pack(fill="x", padx=12, pady=(10, 6))
 
-        source_label = ctk.CTkLabel(source_header, text="Source Folders:", font=ctk.CTkFont(size=13, weight="bold"))
+        source_label = ctk.CTkLabel(source_header, text="Source Folders:", font=self._font(13, "bold"))
         source_label.pack(side="left")
 
         # Add Folder Button
@@ -83,7 +151,7 @@ class BackupApp(ctk.CTk):
             text="➕ Add",
             width=80,
             height=26,
-            font=ctk.CTkFont(size=11),
+            font=self._font(11),
             fg_color=("#3b8ed0", "#1f6aa5"),
             hover_color=("#2d6da8", "#144870"),
             command=self.add_input_folder
@@ -96,7 +164,7 @@ class BackupApp(ctk.CTk):
             text="🗑️ Clear",
             width=80,
             height=26,
-            font=ctk.CTkFont(size=11),
+            font=self._font(11),
             fg_color=("gray70", "gray30"),
             hover_color=("gray60", "gray25"),
             command=self.clear_all_folders
@@ -107,20 +175,25 @@ class BackupApp(ctk.CTk):
         self.folders_scroll = ctk.CTkScrollableFrame(folder_frame, height=60, corner_radius=6)
         self.folders_scroll.pack(fill="both", expand=True, padx=12, pady=(0, 8))
 
-        # Load existing folders
-        self.refresh_folder_list()
+        # Shown only while the list is empty (created once, packed when needed)
+        self.empty_label = ctk.CTkLabel(
+            self.folders_scroll,
+            text="No folders added yet. Click '➕ Add' to add folders.",
+            font=self._font(11),
+            text_color="gray"
+        )
 
         # ===== Destination Folder Section =====
         dest_separator = ctk.CTkFrame(folder_frame, height=2, fg_color=("gray70", "gray30"))
         dest_separator.pack(fill="x", padx=12, pady=6)
 
-        output_label = ctk.CTkLabel(folder_frame, text="Destination:", font=ctk.CTkFont(size=13, weight="bold"))
+        output_label = ctk.CTkLabel(folder_frame, text="Destination:", font=self._font(13, "bold"))
         output_label.pack(anchor="w", padx=12, pady=(6, 4))
 
         dest_frame = ctk.CTkFrame(folder_frame, fg_color="transparent")
         dest_frame.pack(fill="x", padx=12, pady=(0, 10))
 
-        output_entry = ctk.CTkEntry(dest_frame, textvariable=self.output_path, height=32, font=ctk.CTkFont(size=12))
+        output_entry = ctk.CTkEntry(dest_frame, textvariable=self.output_path, height=32, font=self._font(12))
         output_entry.pack(side="left", fill="x", expand=True, padx=(0, 8))
 
         output_btn = ctk.CTkButton(
@@ -128,7 +201,7 @@ class BackupApp(ctk.CTk):
             text="📁 Browse",
             width=110,
             height=30,
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
             fg_color=("#3b8ed0", "#1f6aa5"),
             hover_color=("#2d6da8", "#144870"),
             command=self.select_output_folder
@@ -142,7 +215,7 @@ class BackupApp(ctk.CTk):
         self.backup_now_btn = ctk.CTkButton(
             backup_btn_frame,
             text="⚡ Backup Now",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(16, "bold"),
             height=35,
             corner_radius=6,
             fg_color=("#3b8ed0", "#1f6aa5"),
@@ -155,21 +228,34 @@ class BackupApp(ctk.CTk):
         log_frame = ctk.CTkFrame(main_container, corner_radius=8)
         log_frame.pack(fill="both", expand=True, padx=15, pady=(0, 15))
 
-        log_label = ctk.CTkLabel(log_frame, text="📋 Log:", font=ctk.CTkFont(size=13, weight="bold"))
+        log_label = ctk.CTkLabel(log_frame, text="📋 Log:", font=self._font(13, "bold"))
         log_label.pack(anchor="w", padx=12, pady=(12, 5))
 
-        self.log_textbox = ctk.CTkTextbox(log_frame, height=180, wrap="word", corner_radius=6, font=ctk.CTkFont(size=11))
+        # Read-only; log() enables it only while writing
+        self.log_textbox = ctk.CTkTextbox(log_frame, height=180, wrap="word", corner_radius=6, font=self._font(11),
+                                          state="disabled")
         self.log_textbox.pack(fill="both", expand=True, padx=12, pady=(0, 12))
+        # Single tag for all log text, configured once here instead of per insert
+        self.log_textbox.tag_config("plain", spacing1=0)
 
     def add_input_folder(self):
         """Add source folder"""
-        folder = filedialog.askdirectory(title="Select Source Folder to Add")
+        # Start next to the last added folder
+        initial_dir = (
+            self.config_manager.get('dialog.last_input_dir')
+            or (str(Path(self.input_paths[-1]).parent) if self.input_paths else "")
+            or str(Path.home())
+        )
+        folder = filedialog.askdirectory(title="Select Source Folder to Add", initialdir=initial_dir)
         if folder:
+            self.config_manager.set('dialog.last_input_dir', str(Path(folder).parent))
+            self.config_manager.request_save()
             if folder not in self.input_paths:
                 self.input_paths.append(folder)
                 self.config_manager.add_input_path(folder)
-                self.config_manager.save_config()
-                self.refresh_folder_list()
+                self.config_manager.request_save()
+                self._hide_empty_label()
+                self.add_folder_item(folder)
                 self.log(f"Added source folder: {folder}")
             else:
                 messagebox.showinfo("Info", "This folder is already in the list")
@@ -185,8 +271,10 @@ class BackupApp(ctk.CTk):
             ):
                 self.input_paths.remove(folder_path)
                 self.config_manager.remove_input_path(folder_path)
-                self.config_manager.save_config()
-                self.refresh_folder_list()
+                self.config_manager.request_save()
+                self.folder_items.pop(folder_path).destroy()
+                if not self.input_paths:
+                    self._show_empty_label()
                 self.log(f"Removed source folder: {folder_path}")
 
     def clear_all_folders(self):
@@ -198,40 +286,57 @@ class BackupApp(ctk.CTk):
         if messagebox.askyesno("Confirm", f"Remove all {len(self.input_paths)} source folder(s)?"):
             self.input_paths.clear()
             self.config_manager.clear_input_paths()
-            self.config_manager.save_config()
-            self.refresh_folder_list()
+            self.config_manager.request_save()
+            for item_frame in self.folder_items.values():
+                item_frame.destroy()
+            self.folder_items.clear()
+            self._show_empty_label()
             self.log("Cleared all source folders")
 
+    def _deferred_populate(self):
+        """Load saved source folders from config and list them"""
+        # Own copy: config list only changes through ConfigManager so it gets saved
+        self.input_paths = list(self.config_manager.get('backup.input_paths', []))
+        self.refresh_folder_list()
+
     def refresh_folder_list(self):
-        """Refresh the folder list display"""
+        """
+        Rebuild the folder list display from scratch
+
+        Used for the initial load; adding or removing a folder only updates its own row.
+        """
         # Clear existing items
-        for widget in self.folders_scroll.winfo_children():
-            widget.destroy()
+        for item_frame in self.folder_items.values():
+            item_frame.destroy()
         self.folder_items.clear()
+        self._hide_empty_label()
 
         # Add folders
         if len(self.input_paths) == 0:
-            empty_label = ctk.CTkLabel(
-                self.folders_scroll,
-                text="No folders added yet. Click '➕ Add' to add folders.",
-                font=ctk.CTkFont(size=11),
-                text_color="gray"
-            )
-            empty_label.pack(pady=10)
+            self._show_empty_label()
         else:
             for folder_path in self.input_paths:
                 self.add_folder_item(folder_path)
 
+    def _show_empty_label(self):
+        """Show the "no folders" label in the folder list"""
+        self.empty_label.pack(pady=10)
+
+    def _hide_empty_label(self):
+        """Hide the "no folders" label from the folder list (no-op if hidden)"""
+        self.empty_label.pack_forget()
+
     def add_folder_item(self, folder_path):
         """Add a folder item to the list"""
         item_frame = ctk.CTkFrame(self.folders_scroll, corner_radius=6, height=32)
         item_frame.pack(fill="x", padx=5, pady=2)
+        item_frame.folder_path = folder_path  # Full path; the label may show it shortened
 
         # Folder icon and path
         path_label = ctk.CTkLabel(
             item_frame,
-            text=f"📁 {folder_path}",
-            font=ctk.CTkFont(size=11),
+            text=f"📁 {_shorten(folder_path)}",
+            font=self._font(11),
             anchor="w"
         )
         path_label.pack(side="left", fill="x", expand=True, padx=10, pady=6)
@@ -242,20 +347,27 @@ class BackupApp(ctk.CTk):
             text="✖",
             width=28,
             height=28,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self._font(12, "bold"),
             fg_color=("gray70", "gray30"),
             hover_color=("#e74c3c", "#c0392b"),
-            command=lambda: self.remove_input_folder(folder_path)
+            command=partial(self.remove_input_folder, folder_path)
         )
         remove_btn.pack(side="right", padx=6, pady=4)
 
-        self.folder_items.append(item_frame)
+        self.folder_items[folder_path] = item_frame
 
     def select_output_folder(self):
         """Select destination folder"""
-        folder = filedialog.askdirectory(title="Select Destination Folder")
+        initial_dir = (
+            self.config_manager.get('dialog.last_output_dir')
+            or self.output_path.get()
+            or str(Path.home())
+        )
+        folder = filedialog.askdirectory(title="Select Destination Folder", initialdir=initial_dir)
         if folder:
             self.output_path.set(folder)
+            self.config_manager.set('dialog.last_output_dir', folder)
+            self.config_manager.request_save()
             self.log(f"Selected destination folder: {folder}")
 
     def backup_now(self):
@@ -274,14 +386,14 @@ class BackupApp(ctk.CTk):
             messagebox.showerror("Error", "Please select destination folder")
             return
 
-        # Run in separate thread
+        # Run on the backup worker thread (with a copy of the folder list,
+        # which may be edited while the backup runs)
         self.is_backing_up = True
         self.backup_now_btn.configure(state="disabled", text="Backing up...")
-        thread = threading.Thread(target=self._run_backup, args=(self.input_paths, output_path), daemon=True)
-        thread.start()
+        self._submit_background(self._run_backup, list(self.input_paths), output_path)
 
     def _run_backup(self, input_paths, output_path):
-        """Run backup (called from thread)"""
+        """Run backup (called on backup worker thread)"""
         try:
             # Set callback
             self.backup_engine.set_progress_callback(self.update_progress)
@@ -289,47 +401,146 @@ class BackupApp(ctk.CTk):
             # Run multi-folder backup
             result = self.backup_engine.backup_multiple(input_paths, output_path)
 
-            # Show result
-            if result['success']:
-                self.after(0, lambda: messagebox.showinfo(
-                    "Success",
-                    f"Backup completed successfully\n\n"
-                    f"Total folders: {result['total_folders']}\n"
-                    f"Successful: {result['successful']}\n"
-                    f"Time elapsed: {result['elapsed_time']:.2f} seconds"
-                ))
-
-                # Update last backup time
-                self.config_manager.update_last_backup()
-                # Save paths
-                self.config_manager.set_backup_settings(input_paths, output_path)
+            # Record and show result (on the Tk thread)
+            if result['success'] and not self._call_on_ui(self._persist_backup_state, output_path):
+                # Window was closed during the backup: nothing runs on the Tk thread
+                # anymore, so store the result here and write it right away
+                self._persist_backup_state(output_path)
                 self.config_manager.save_config()
-
-            else:
-                failed_count = result['failed']
-                self.after(0, lambda: messagebox.showerror(
-                    "Error",
-                    f"Backup completed with errors\n\n"
-                    f"Total folders: {result['total_folders']}\n"
-                    f"Successful: {result['successful']}\n"
-                    f"Failed: {failed_count}\n\n"
-                    f"Check logs for details"
-                ))
+            self._call_on_ui(self._show_backup_result, result)
 
         finally:
             self.is_backing_up = False
-            self.after(0, lambda: self.backup_now_btn.configure(state="normal", text="⚡ Backup Now"))
+            self._call_on_ui(self._reset_backup_button)
+
+    def _call_on_ui(self, fn, *args):
+        """
+        Schedule a function on the Tk thread (from the backup worker thread)
+
+        Args:
+            fn: function to run
+            *args: arguments for fn
+
+        Returns:
+            bool: False if the window is already closed (fn is not scheduled)
+        """
+        if self._closing:
+            return False
+        try:
+            self.after(0, fn, *args)
+        except (RuntimeError, TclError):
+            # Window was destroyed between the check and the call
+            return False
+        return True
+
+    def _persist_backup_state(self, output_path):
+        """
+        Store last backup time and destination folder
+
+        Source folders are not written here: they are saved as they are added or
+        removed, and the list may have changed while the backup ran.
+        Called on the Tk thread, or on the backup worker thread once the window is closed.
+        """
+        self.config_manager.update_last_backup()
+        # Written after a short delay, together with other changes
+        self.config_manager.set('backup.output_path', output_path)
+        self.config_manager.request_save()
+
+    def _show_backup_result(self, result):
+        """Show backup result dialog (called on Tk thread)"""
+        if result['success']:
+            messagebox.showinfo(
+                "Success",
+                f"Backup completed successfully\n\n"
+                f"Total folders: {result['total_folders']}\n"
+                f"Successful: {result['successful']}\n"
+                f"Time elapsed: {result['elapsed_time']:.2f} seconds"
+            )
+        else:
+            messagebox.showerror(
+                "Error",
+                f"Backup completed with errors\n\n"
+                f"Total folders: {result['total_folders']}\n"
+                f"Successful: {result['successful']}\n"
+                f"Failed: {result['failed']}\n\n"
+                f"Check logs for details"
+            )
+
+    def _reset_backup_button(self):
+        """Re-enable Backup Now button (called on Tk thread)"""
+        self.backup_now_btn.configure(state="normal", text="⚡ Backup Now")
 
     def update_progress(self, current, total, message):
-        """Update progress (called from backup engine)"""
-        self.after(0, lambda: self.log(message))
+        """Update progress (called from backup engine on the backup thread)"""
+        # Drop messages arriving faster than the log box can usefully show them
+        # (e.g. several engines reporting at once); the final one always passes
+        now = time.monotonic()
+        if current != total:
+            if now - self._last_progress_time < PROGRESS_MIN_INTERVAL:
+                return
+            # Same text again, or less than PROGRESS_MIN_DELTA further along
+            # (a lower count means the next folder has started, so it passes)
+            if message == self._last_progress_msg:
+                return
+            delta = current - self._last_progress_current
+            if total and 0 <= delta < total * PROGRESS_MIN_DELTA:
+                return
+        self._last_progress_time = now
+        self._last_progress_current = current
+        self._last_progress_msg = message
+
+        # Only queued here; the Tk thread writes queued messages in batches
+        self.log_queue.put(message)
+
+    def _submit_background(self, fn, *args):
+        """
+        Run a function on the background worker thread
+
+        Messages it puts on log_queue are shown while it runs.
+
+        Args:
+            fn: function to run
+            *args: arguments for fn
+
+        Returns:
+            Future of the call
+        """
+        future = self.background_executor.submit(fn, *args)
+        self._pending_tasks.add(future)
+        future.add_done_callback(self._pending_tasks.discard)
+        self._start_log_pump()
+        return future
+
+    def _start_log_pump(self):
+        """Schedule the next write of queued progress messages"""
+        if not self._log_pump_scheduled:
+            self._log_pump_scheduled = True
+            self.after(LOG_PUMP_INTERVAL_MS, self._drain_log_queue)
+
+    def _drain_log_queue(self):
+        """Write all queued log messages to the log box with a single insert"""
+        self._log_pump_scheduled = False
+
+        messages = []
+        try:
+            while True:
+                messages.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if messages:
+            self._write_log("\n".join(messages))
+
+        # Keep pumping while background work can still queue messages
+        if self._pending_tasks or not self.log_queue.empty():
+            self._start_log_pump()
 
     def load_settings(self):
         """Load settings"""
         self.log("Settings loaded successfully")
 
     def run_log_maintenance(self):
-        """Run log maintenance"""
+        """Run log maintenance (called on background worker thread)"""
         try:
             retention_days = self.config_manager.get('logs.retention_days', 30)
             self.log_manager.retention_days = retention_days
@@ -337,18 +548,55 @@ class BackupApp(ctk.CTk):
             result = self.log_manager.run_maintenance()
 
             if result['deleted_logs'] > 0:
-                self.log(f"Deleted old log files: {result['deleted_logs']} files ({format_bytes(result['deleted_bytes'])})")
+                self.log_queue.put(
+                    f"Deleted old log files: {result['deleted_logs']} files ({format_bytes(result['deleted_bytes'])})"
+                )
 
         except Exception as e:
-            self.log(f"Error in log maintenance: {e}")
+            self.log_queue.put(f"Error in log maintenance: {e}")
 
     def log(self, message):
-        """Display log in textbox"""
-        self.log_textbox.insert("end", f"{message}\n")
-        self.log_textbox.see("end")
+        """
+        Display log in textbox
+
+        The message is written together with other queued messages on the next
+        log pump run, so bursts of messages cost one textbox update.
+        Must be called on the Tk thread; worker threads put on log_queue directly.
+        """
+        self.log_queue.put(message)
+        self._start_log_pump()
+
+    def _write_log(self, text):
+        """Append text to textbox (keeps the last MAX_LOG_LINES lines)"""
+        # Follow new text only if the user hasn't scrolled up to read older lines
+        at_bottom = self.log_textbox.yview()[1] >= 0.99
+
+        self.log_textbox.configure(state="normal")
+        self.log_textbox.insert("end", f"{text}\n", ("plain",))
+
+        # Line count of the text (last line is the empty one after the final newline)
+        line_count = int(self.log_textbox.index("end-1c").split('.')[0]) - 1
+        overflow = line_count - MAX_LOG_LINES
+        if overflow > 0:
+            self.log_textbox.delete("1.0", f"{overflow + 1}.0")
+
+        self.log_textbox.configure(state="disabled")
+        if at_bottom:
+            self.log_textbox.see("end")
 
     def on_closing(self):
         """Close application"""
+        # Close the window right away; a running backup still finishes
+        # (so no half-written ZIP is left) and saves its result itself
+        # before the process exits
+        self._closing = True
+        self.background_executor.shutdown(wait=False)
+        # Write settings whose delayed save hasn't run yet
+        self.config_manager.save_config()
+        # Flush queued log records now; if a backup is still running it keeps
+        # logging, and the logger is closed at exit instead
+        if not self._pending_tasks:
+            self.logger.close()
         self.destroy()
 
 
@@ -5,11 +5,33 @@ Automatic Log File Management System
 - Compress log files (optional)
 """
 
+import logging
 import os
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-import zipfile
+
+
+# Errors go through the app logger, which writes them on its background thread
+_logger = logging.getLogger("BackupApp")
+
+# Number of stat() calls kept in flight when summarizing a large log folder
+STAT_WORKERS = 16
+
+# Below this many files the thread pool costs more than it saves
+PARALLEL_STAT_MIN_FILES = 64
+
+# Log and log archive files all start with this prefix
+LOG_PREFIX = "backup_"
+
+# Deflate level for compressed logs (fastest; text logs still shrink a lot)
+LOG_COMPRESS_LEVEL = 1
+
+# Bytes read and compressed per chunk when zipping a log
+LOG_COMPRESS_BUFFER_SIZE = 1024 * 1024
+
+# Units used by format_bytes
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 
 class LogManager:
@@ -25,12 +47,35 @@ class LogManager:
             max_file_size_mb: maximum log file size (MB) (default: 10 MB)
         """
         self.log_dir = Path(log_dir)
+        self.log_dir_str = str(self.log_dir)  # Used by the scan loops, which work on plain strings
         self.retention_days = retention_days
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
 
         # Create folder if it doesn't exist
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
+    def _scan(self):
+        """
+        List log folder files in a single directory pass
+
+        Returns:
+            list: os.DirEntry of each file whose name starts with LOG_PREFIX
+        """
+        files = []
+
+        with os.scandir(self.log_dir_str) as entries:
+            for entry in entries:
+                if not entry.name.startswith(LOG_PREFIX):
+                    continue
+
+                try:
+                    if entry.is_file():
+                        files.append(entry)
+                except Exception as e:
+                    _logger.warning("Error reading %s: %s", entry.path, e)
+
+        return files
+
     def cleanup_old_logs(self):
         """
         Delete old log files that exceed retention period
@@ -38,48 +83,52 @@ class LogManager:
         Returns:
             tuple: (number of deleted files, number of deleted bytes)
         """
-        if not self.log_dir.exists():
+        if not os.path.exists(self.log_dir_str):
             return 0, 0
 
-        cutoff_date = datetime.now() - timedelta(days=self.retention_days)
+        # POSIX timestamp, compared directly with st_mtime
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).timestamp()
         deleted_count = 0
         deleted_bytes = 0
 
-        # Loop through all files in log folder
-        for log_file in self.log_dir.glob("backup_*.log"):
+        # Loop through all log files in log folder
+        for entry in self._scan():
+            if not entry.name.endswith(".log"):
+                continue
+
             try:
-                # Check last modified date
-                file_mtime = datetime.fromtimestamp(log_file.stat().st_mtime)
+                # Check last modified date (one stat for date and size)
+                stat = entry.stat()
 
-                if file_mtime < cutoff_date:
-                    file_size = log_file.stat().st_size
-                    log_file.unlink()  # Delete file
+                if stat.st_mtime < cutoff:
+                    os.unlink(entry.path)  # Delete file
                     deleted_count += 1
-                    deleted_bytes += file_size
+                    deleted_bytes += stat.st_size
 
             except Exception as e:
-                print(f"Error deleting {log_file}: {e}")
+                _logger.warning("Error deleting %s: %s", entry.path, e)
 
         return deleted_count, deleted_bytes
 
     def cleanup_zip_files(self):
         """Delete old zip files"""
-        if not self.log_dir.exists():
+        if not os.path.exists(self.log_dir_str):
             return 0
 
-        cutoff_date = datetime.now() - timedelta(days=self.retention_days)
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).timestamp()
         deleted_count = 0
 
-        for zip_file in self.log_dir.glob("backup_*.zip"):
-            try:
-                file_mtime = datetime.fromtimestamp(zip_file.stat().st_mtime)
+        for entry in self._scan():
+            if not entry.name.endswith(".zip"):
+                continue
 
-                if file_mtime < cutoff_date:
-                    zip_file.unlink()
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
                     deleted_count += 1
 
             except Exception as e:
-                print(f"Error deleting {zip_file}: {e}")
+                _logger.warning("Error deleting %s: %s", entry.path, e)
 
         return deleted_count
 
@@ -111,33 +160,52 @@ class LogManager:
         Returns:
             int: number of compressed files
         """
-        if not self.log_dir.exists():
+        if not os.path.exists(self.log_dir_str):
             return 0
 
-        cutoff_date = datetime.now() - timedelta(days=days_threshold)
+        cutoff = (datetime.now() - timedelta(days=days_threshold)).timestamp()
         compressed_count = 0
 
-        for log_file in self.log_dir.glob("backup_*.log"):
-            try:
-                file_mtime = datetime.fromtimestamp(log_file.stat().st_mtime)
+        for entry in self._scan():
+            if not entry.name.endswith(".log"):
+                continue
 
+            try:
                 # Compress files older than threshold
-                if file_mtime < cutoff_date:
-                    zip_path = log_file.with_suffix('.log.zip')
-
-                    # Create zip file
-                    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                        zipf.write(log_file, log_file.name)
-
-                    # Delete original file
-                    log_file.unlink()
+                if entry.stat().st_mtime < cutoff:
+                    self._compress_log(entry)
                     compressed_count += 1
 
             except Exception as e:
-                print(f"Error compressing {log_file}: {e}")
+                _logger.warning("Error compressing %s: %s", entry.path, e)
 
         return compressed_count
 
+    def _compress_log(self, entry):
+        """
+        Compress one log file to <name>.zip and delete the original
+
+        Args:
+            entry: os.DirEntry of the log file
+        """
+        # Imported here: compression is optional, so most runs never need these
+        import shutil
+        import zipfile
+
+        # Entry keeps the log's modification time and file mode (like ZipFile.write)
+        zinfo = zipfile.ZipInfo.from_file(entry.path, entry.name)
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo._compresslevel = LOG_COMPRESS_LEVEL  # ZipFile.open() doesn't apply compresslevel
+        force_zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT
+
+        # Create zip file, streaming the log in large chunks
+        with zipfile.ZipFile(f"{entry.path}.zip", 'w') as zipf:
+            with open(entry.path, 'rb') as src, zipf.open(zinfo, 'w', force_zip64=force_zip64) as dst:
+                shutil.copyfileobj(src, dst, LOG_COMPRESS_BUFFER_SIZE)
+
+        # Delete original file
+        os.unlink(entry.path)
+
     def get_log_files_info(self):
         """
         Get information of all log files
@@ -145,33 +213,109 @@ class LogManager:
         Returns:
             list: list of dict containing log file information
         """
-        if not self.log_dir.exists():
+        if not os.path.exists(self.log_dir_str):
             return []
 
         log_files = []
 
-        for log_file in sorted(self.log_dir.glob("backup_*.log*"), reverse=True):
+        prefix_len = len(LOG_PREFIX)
+
+        for entry in sorted(self._scan(), key=lambda e: e.name, reverse=True):
+            # Same selection as glob("backup_*.log*")
+            if ".log" not in entry.name[prefix_len:]:
+                continue
+
             try:
-                stat = log_file.stat()
-                log_files.append({
-                    'name': log_file.name,
-                    'path': str(log_file),
-                    'size': stat.st_size,
-                    'size_mb': round(stat.st_size / (1024 * 1024), 2),
-                    'modified': datetime.fromtimestamp(stat.st_mtime),
-                    'is_compressed': log_file.suffix == '.zip'
-                })
+                log_files.append(self._build_file_info(entry.name, entry.path, entry.stat()))
             except Exception as e:
-                print(f"Error reading {log_file}: {e}")
+                _logger.warning("Error reading %s: %s", entry.path, e)
 
         return log_files
 
-    def run_maintenance(self, compress_logs=False):
+    def _build_file_info(self, name, path, stat):
+        """
+        Build information dict of one log file
+
+        Args:
+            name: file name
+            path: file path
+            stat: os.stat_result of the file
+
+        Returns:
+            dict: log file information
+        """
+        return {
+            'name': name,
+            'path': path,
+            'size': stat.st_size,
+            'size_mb': round(stat.st_size / (1024 * 1024), 2),
+            'modified': datetime.fromtimestamp(stat.st_mtime),
+            'is_compressed': name.endswith('.zip')
+        }
+
+    def _stat_entry(self, entry):
+        """
+        Stat a directory entry
+
+        Args:
+            entry: os.DirEntry of the file
+
+        Returns:
+            os.stat_result or None if the file could not be read
+        """
+        try:
+            return entry.stat()
+        except Exception as e:
+            _logger.warning("Error reading %s: %s", entry.path, e)
+            return None
+
+    def summarize(self):
+        """
+        Get log files information and total log size in a single directory pass
+
+        Returns:
+            tuple: (list of log file info dicts, total size in bytes, total size in MB)
+        """
+        if not os.path.exists(self.log_dir_str):
+            return [], 0, 0
+
+        prefix_len = len(LOG_PREFIX)
+        # Same selection as glob("backup_*.*") / glob("backup_*.log*")
+        candidates = [entry for entry in self._scan() if "." in entry.name[prefix_len:]]
+
+        # On Windows DirEntry.stat() is already cached from the directory listing;
+        # elsewhere each stat() is a syscall, so keep several in flight on large folders
+        if os.name != 'nt' and len(candidates) >= PARALLEL_STAT_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=STAT_WORKERS) as executor:
+                stats = list(executor.map(self._stat_entry, candidates))
+        else:
+            stats = [self._stat_entry(entry) for entry in candidates]
+
+        log_files = []
+        total_bytes = 0
+
+        for entry, stat in zip(candidates, stats):
+            if stat is None:
+                continue
+
+            total_bytes += stat.st_size
+            if ".log" in entry.name[prefix_len:]:
+                log_files.append(self._build_file_info(entry.name, entry.path, stat))
+
+        log_files.sort(key=lambda info: info['name'], reverse=True)
+        total_mb = round(total_bytes / (1024 * 1024), 2)
+        return log_files, total_bytes, total_mb
+
+    def run_maintenance(self, compress_logs=False, days_threshold=7):
         """
         Run log files maintenance
 
+        Deletes old logs and zips and (if enabled) compresses remaining old logs
+        in a single pass over the log folder.
+
         Args:
             compress_logs: True if old logs should be compressed
+            days_threshold: age in days from which logs are compressed (default: 7 days)
 
         Returns:
             dict: summary of maintenance results
@@ -183,17 +327,36 @@ class LogManager:
             'compressed_logs': 0
         }
 
-        # Delete old log files
-        deleted_count, deleted_bytes = self.cleanup_old_logs()
-        result['deleted_logs'] = deleted_count
-        result['deleted_bytes'] = deleted_bytes
+        if not os.path.exists(self.log_dir_str):
+            return result
+
+        # Cutoffs as POSIX timestamps, compared directly with st_mtime
+        now = datetime.now()
+        cutoff_delete = (now - timedelta(days=self.retention_days)).timestamp()
+        cutoff_compress = (now - timedelta(days=days_threshold)).timestamp()
 
-        # Delete old zip files
-        result['deleted_zips'] = self.cleanup_zip_files()
+        for entry in self._scan():
+            name = entry.name
+            is_log = name.endswith(".log")
+            if not is_log and not name.endswith(".zip"):
+                continue
 
-        # Compress old logs (if enabled)
-        if compress_logs:
-            result['compressed_logs'] = self.compress_old_logs()
+            try:
+                stat = entry.stat()
+
+                if stat.st_mtime < cutoff_delete:
+                    os.unlink(entry.path)
+                    if is_log:
+                        result['deleted_logs'] += 1
+                        result['deleted_bytes'] += stat.st_size
+                    else:
+                        result['deleted_zips'] += 1
+                elif is_log and compress_logs and stat.st_mtime < cutoff_compress:
+                    self._compress_log(entry)
+                    result['compressed_logs'] += 1
+
+            except Exception as e:
+                _logger.warning("Error maintaining %s: %s", entry.path, e)
 
         return result
 
@@ -204,14 +367,19 @@ class LogManager:
         Returns:
             tuple: (total size in bytes, total size in MB)
         """
-        if not self.log_dir.exists():
+        if not os.path.exists(self.log_dir_str):
             return 0, 0
 
+        prefix_len = len(LOG_PREFIX)
         total_bytes = 0
 
-        for log_file in self.log_dir.glob("backup_*.*"):
+        for entry in self._scan():
+            # Same selection as glob("backup_*.*")
+            if "." not in entry.name[prefix_len:]:
+                continue
+
             try:
-                total_bytes += log_file.stat().st_size
+                total_bytes += entry.stat().st_size
             except Exception:
                 pass
 
@@ -229,8 +397,8 @@ def format_bytes(bytes_size):
     Returns:
         str: size in human-readable format (KB, MB, GB)
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.2f} {unit}"
-        bytes_size /= 1024.0
-    return f"{bytes_size:.2f} PB"
+    if bytes_size < 1024:
+        return f"{bytes_size:.2f} B"
+    # Unit index straight from the bit length (each unit is 2**10 larger)
+    index = min((int(bytes_size).bit_length() - 1) // 10, len(BYTE_UNITS) - 1)
+    return f"{bytes_size / (1 << (index * 10)):.2f} {BYTE_UNITS[index]}"
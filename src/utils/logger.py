@@ -2,14 +2,23 @@
 Logging System for Backup Application
 - Create daily log files (backup_YYYY-MM-DD.log)
 - Support both console and file output
+- Write log output on a background thread (callers only enqueue records)
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
 
 
+# Guards creating the singleton and replacing the "BackupApp" logger handlers
+_logger_lock = threading.RLock()
+
+
 class BackupLogger:
     """Manage logging for backup system"""
 
@@ -31,9 +40,7 @@ class BackupLogger:
         self.logger = logging.getLogger("BackupApp")
         self.logger.setLevel(logging.DEBUG)
 
-        # Remove old handlers if exists (prevent duplication)
-        if self.logger.handlers:
-            self.logger.handlers.clear()
+        handlers = []
 
         # Create formatter
         formatter = logging.Formatter(
@@ -48,13 +55,46 @@ class BackupLogger:
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
         # Console handler - display log on console
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+        # Logging calls (e.g. from backup worker threads) only put the record on a
+        # queue; a single listener thread formats it and writes to file and console
+        log_queue = queue.SimpleQueue()
+        self._queue_handler = logging.handlers.QueueHandler(log_queue)
+        with _logger_lock:
+            # Replace old handlers if exists (prevent duplication)
+            self.logger.handlers.clear()
+            self.logger.addHandler(self._queue_handler)
+        self.listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self.listener.start()
+        atexit.register(self.close)
+
+    def close(self):
+        """
+        Write all queued log records, stop the writer thread and close the log file
+
+        Safe to call more than once; later calls do nothing.
+        """
+        if self.listener is None:
+            return
+
+        with _logger_lock:
+            # Only removes it if a newer BackupLogger hasn't replaced it already
+            self.logger.removeHandler(self._queue_handler)
+
+        self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
+        self.listener = None
+        atexit.unregister(self.close)
 
     def info(self, message):
         """Log info message"""
@@ -96,5 +136,8 @@ def get_logger(log_dir="logs"):
     """
     global _logger_instance
     if _logger_instance is None:
-        _logger_instance = BackupLogger(log_dir)
+        with _logger_lock:
+            # Checked again: another thread may have created it while we waited
+            if _logger_instance is None:
+                _logger_instance = BackupLogger(log_dir)
     return _logger_instance